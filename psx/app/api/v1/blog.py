@@ -1,42 +1,124 @@
 """博客API路由"""
 
-from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response
 
+from app.core.clock import utc_timestamp
 from app.services.blog import BlogService
 from app.models.blog import BlogDataResponse, ArticleResponse, CategoryResponse
 
 router = APIRouter()
 blog_service = BlogService()
 
+CACHE_HEADERS = {
+    "Cache-Control": "public, s-maxage=60, stale-while-revalidate=300",
+    "Vary": "Accept-Encoding"
+}
+
+# 统一响应格式中 data 字段之前的固定部分
+ENVELOPE_PREFIX = b'{"success":true,"data":'
+
+
+def _envelope_suffix(message: str) -> bytes:
+    """拼装统一响应格式中 data 字段之后的部分"""
+    return b"".join((
+        b',"message":',
+        orjson.dumps(message),
+        b',"timestamp":',
+        orjson.dumps(utc_timestamp()),
+        b"}",
+    ))
+
+
+def _envelope(data: bytes, message: str) -> bytes:
+    """拼装统一响应格式的响应体"""
+    return b"".join((ENVELOPE_PREFIX, data, _envelope_suffix(message)))
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """判断客户端是否接受gzip编码"""
+    if not accept_encoding:
+        return False
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        q = params.strip().replace(" ", "")
+        if not q.startswith("q="):
+            return True
+        try:
+            return float(q[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def cached_json_response(data: bytes, message: str, pretty: bool = False) -> Response:
+    """将已序列化的数据拼装为统一响应格式
+    
+    Args:
+        data: 已序列化的 data 字段JSON字节
+        message: 响应消息
+        pretty: 是否缩进输出，默认输出紧凑JSON
+        
+    Returns:
+        Response: 仅序列化消息和时间戳，数据部分直接复用缓存字节
+    """
+    body = _envelope(data, message)
+    if pretty:
+        # 仅在调试时按需格式化，默认路径不付出缩进的编码和传输开销
+        body = orjson.dumps(orjson.loads(body), option=orjson.OPT_INDENT_2)
+    return Response(
+        content=body,
+        media_type="application/json; charset=utf-8",
+        headers=CACHE_HEADERS
+    )
+
+
+async def compressed_json_response(key: str, data: bytes, message: str,
+                                   accept_encoding: Optional[str]) -> Response:
+    """返回gzip编码的统一格式响应
+    
+    data 部分按缓存数据只压缩一次，每次请求只压缩带时间戳的后缀，客户端不接受gzip时退回未压缩响应。
+    
+    Args:
+        key: 缓存键
+        data: 已序列化的 data 字段JSON字节
+        message: 响应消息
+        accept_encoding: 请求的 Accept-Encoding 头
+        
+    Returns:
+        Response: gzip编码的响应，或未压缩的响应
+    """
+    if not _accepts_gzip(accept_encoding):
+        return cached_json_response(data, message)
+    
+    body = await blog_service.compress(key, data, ENVELOPE_PREFIX, _envelope_suffix(message))
+    
+    return Response(
+        content=body,
+        media_type="application/json; charset=utf-8",
+        headers={**CACHE_HEADERS, "Content-Encoding": "gzip"}
+    )
+
 
 @router.get("/blog-data", response_model=BlogDataResponse)
-async def get_blog_data():
+async def get_blog_data(
+    pretty: bool = Query(False, description="是否格式化输出JSON"),
+    accept_encoding: Optional[str] = Header(None)
+):
     """获取完整的博客数据
     
     Returns:
         BlogDataResponse: 包含所有分类和文章的博客数据
     """
     try:
-        data = await blog_service.get_blog_data()
-        
-        response_data = {
-            "success": True,
-            "data": data,
-            "message": "博客数据获取成功",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        
-        return JSONResponse(
-            status_code=200,
-            content=response_data,
-            headers={
-                "Cache-Control": "public, s-maxage=60, stale-while-revalidate=300",
-                "Content-Type": "application/json; charset=utf-8"
-            }
-        )
+        data = await blog_service.get_blog_data_json()
+        if pretty:
+            return cached_json_response(data, "博客数据获取成功", pretty)
+        return await compressed_json_response("blog-data", data, "博客数据获取成功", accept_encoding)
         
     except Exception as e:
         raise HTTPException(
@@ -52,19 +134,21 @@ async def get_blog_data():
 @router.get("/articles/{category}/{article_id}", response_model=ArticleResponse)
 async def get_article(
     category: str,
-    article_id: str
+    article_id: str,
+    pretty: bool = Query(False, description="是否格式化输出JSON")
 ):
     """获取指定文章详情
     
     Args:
         category: 分类标识符
         article_id: 文章ID
+        pretty: 是否格式化输出JSON
         
     Returns:
         ArticleResponse: 文章详细信息
     """
     try:
-        article = await blog_service.get_article_content(category, article_id)
+        article = await blog_service.get_article_json(category, article_id)
         
         if not article:
             raise HTTPException(
@@ -76,21 +160,7 @@ async def get_article(
                 }
             )
         
-        response_data = {
-            "success": True,
-            "data": article,
-            "message": "文章获取成功",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        
-        return JSONResponse(
-            status_code=200,
-            content=response_data,
-            headers={
-                "Cache-Control": "public, s-maxage=60, stale-while-revalidate=300",
-                "Content-Type": "application/json; charset=utf-8"
-            }
-        )
+        return cached_json_response(article, "文章获取成功", pretty)
         
     except HTTPException:
         raise
@@ -107,18 +177,20 @@ async def get_article(
 
 @router.get("/categories/{category}", response_model=CategoryResponse)
 async def get_category(
-    category: str
+    category: str,
+    pretty: bool = Query(False, description="是否格式化输出JSON")
 ):
     """获取指定分类详情
     
     Args:
         category: 分类标识符
+        pretty: 是否格式化输出JSON
         
     Returns:
         CategoryResponse: 分类详细信息
     """
     try:
-        category_data = await blog_service.get_category_content(category)
+        category_data = await blog_service.get_category_json(category)
         
         if not category_data:
             raise HTTPException(
@@ -130,21 +202,7 @@ async def get_category(
                 }
             )
         
-        response_data = {
-            "success": True,
-            "data": category_data,
-            "message": "分类获取成功",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        
-        return JSONResponse(
-            status_code=200,
-            content=response_data,
-            headers={
-                "Cache-Control": "public, s-maxage=60, stale-while-revalidate=300",
-                "Content-Type": "application/json; charset=utf-8"
-            }
-        )
+        return cached_json_response(category_data, "分类获取成功", pretty)
         
     except HTTPException:
         raise
@@ -160,32 +218,17 @@ async def get_category(
 
 
 @router.get("/categories")
-async def get_categories_list():
+async def get_categories_list(
+    pretty: bool = Query(False, description="是否格式化输出JSON")
+):
     """获取所有分类列表
     
     Returns:
         dict: 分类列表信息
     """
     try:
-        data = await blog_service.get_blog_data()
-        
-        response_data = {
-            "success": True,
-            "data": {
-                "blogInfoPool": data.get("categories", {})
-            },
-            "message": "分类列表获取成功",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        
-        return JSONResponse(
-            status_code=200,
-            content=response_data,
-            headers={
-                "Cache-Control": "public, s-maxage=60, stale-while-revalidate=300",
-                "Content-Type": "application/json; charset=utf-8"
-            }
-        )
+        data = await blog_service.get_categories_json()
+        return cached_json_response(data, "分类列表获取成功", pretty)
         
     except Exception as e:
         raise HTTPException(
@@ -206,22 +249,21 @@ async def force_scan():
         dict: 扫描结果信息
     """
     try:
-        # 清除缓存并重新扫描
-        await blog_service.clear_cache()
-        data = await blog_service.get_blog_data()
+        # 跳过可能已过期的博客数据文件，直接扫描文件系统并回写
+        data = await blog_service.rescan()
         
         response_data = {
             "success": True,
             "data": {
                 "message": "文件重新扫描完成",
                 "categories_found": len(data.get("categories", {})),
-                "scan_time": datetime.utcnow().isoformat() + "Z"
+                "scan_time": utc_timestamp()
             },
             "message": "扫描完成",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_timestamp()
         }
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content=response_data
         )
@@ -2,75 +2,115 @@
 
 import os
 import time
-from datetime import datetime
+from typing import Any, Dict
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
-from app.services.blog import BlogService
+from app.core.clock import utc_timestamp
+from app.api.v1.blog import blog_service
 
 router = APIRouter()
 
 
+def build_health_response(data_sources: Dict[str, Any]) -> ORJSONResponse:
+    """构建健康检查响应
+    
+    Args:
+        data_sources: 数据源状态信息
+        
+    Returns:
+        ORJSONResponse: 服务健康状态信息
+    """
+    health_data = {
+        "success": True,
+        "data": {
+            "status": "healthy",
+            "service": settings.APP_NAME,
+            "version": settings.APP_VERSION,
+            "timestamp": utc_timestamp(),
+            "uptime": time.time(),
+            "environment": {
+                "docs_dir": settings.DOCS_DIR,
+                "categories_dir": settings.CATEGORIES_DIR,
+                "content_dir": settings.CONTENT_DIR,
+                "blog_data_file": settings.BLOG_DATA_FILE
+            },
+            "data_sources": {
+                **data_sources,
+                "cache_enabled": settings.CACHE_ENABLED,
+                "cache_ttl": settings.CACHE_TTL
+            }
+        },
+        "timestamp": utc_timestamp()
+    }
+    
+    return ORJSONResponse(
+        status_code=200,
+        content=health_data,
+        headers={
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "Pragma": "no-cache",
+            "Expires": "0"
+        }
+    )
+
+
+def build_health_error(e: Exception) -> ORJSONResponse:
+    """构建健康检查失败响应"""
+    error_data = {
+        "success": False,
+        "error": {
+            "code": "HEALTH_CHECK_FAILED",
+            "message": "健康检查失败",
+            "details": {"error": str(e)}
+        },
+        "timestamp": utc_timestamp()
+    }
+    
+    return ORJSONResponse(
+        status_code=503,
+        content=error_data
+    )
+
+
 @router.get("/health")
 async def health_check():
     """健康检查端点
     
+    只报告最近一次加载的缓存状态，不访问文件系统，适合高频探活。
+    
+    Returns:
+        dict: 服务健康状态信息
+    """
+    try:
+        return build_health_response({
+            "categories_cached": blog_service.last_category_count
+        })
+        
+    except Exception as e:
+        return build_health_error(e)
+
+
+@router.get("/health/deep")
+async def deep_health_check():
+    """深度健康检查端点
+    
+    实际扫描分类目录并检查数据文件，开销较大。
+    
     Returns:
         dict: 服务健康状态信息
     """
     try:
         # 检查数据源状态
-        blog_service = BlogService()
         categories_count = len(await blog_service.scan_categories())
         json_file_exists = os.path.exists(settings.BLOG_DATA_FILE)
         
-        health_data = {
-            "success": True,
-            "data": {
-                "status": "healthy",
-                "service": settings.APP_NAME,
-                "version": settings.APP_VERSION,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "uptime": time.time(),
-                "environment": {
-                    "docs_dir": settings.DOCS_DIR,
-                    "categories_dir": settings.CATEGORIES_DIR,
-                    "content_dir": settings.CONTENT_DIR,
-                    "blog_data_file": settings.BLOG_DATA_FILE
-                },
-                "data_sources": {
-                    "categories_from_scan": categories_count,
-                    "json_file_exists": json_file_exists,
-                    "cache_enabled": settings.CACHE_ENABLED,
-                    "cache_ttl": settings.CACHE_TTL
-                }
-            },
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        
-        return JSONResponse(
-            status_code=200,
-            content=health_data,
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0"
-            }
-        )
+        return build_health_response({
+            "categories_cached": blog_service.last_category_count,
+            "categories_from_scan": categories_count,
+            "json_file_exists": json_file_exists
+        })
         
     except Exception as e:
-        error_data = {
-            "success": False,
-            "error": {
-                "code": "HEALTH_CHECK_FAILED",
-                "message": "健康检查失败",
-                "details": {"error": str(e)}
-            },
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        
-        return JSONResponse(
-            status_code=503,
-            content=error_data
-        )
\ No newline at end of file
+        return build_health_error(e)
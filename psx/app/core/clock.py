@@ -0,0 +1,22 @@
+"""时间戳工具"""
+
+import time
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# 按秒缓存的时间戳: [秒, 格式化后的字符串]
+_ts_cache = [0, ""]
+
+
+def utc_timestamp() -> str:
+    """获取当前UTC时间戳字符串
+
+    时间戳精确到秒，同一秒内的请求复用同一个字符串，避免逐请求格式化。
+
+    Returns:
+        str: ISO 8601 格式的UTC时间，如 2024-01-01T00:00:00Z
+    """
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[:] = [now, time.strftime(TIMESTAMP_FORMAT, time.gmtime(now))]
+    return _ts_cache[1]
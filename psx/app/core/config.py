@@ -1,8 +1,8 @@
 """应用配置管理"""
 
-import os
 from typing import List
 from pathlib import Path
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
     # 服务器配置
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WORKERS: int = 1  # 生产环境的工作进程数，DEBUG模式下固定为1
     
     # CORS配置
     ALLOWED_ORIGINS: List[str] = [
@@ -35,6 +36,11 @@ class Settings(BaseSettings):
     # 缓存配置
     CACHE_TTL: int = 60  # 缓存时间（秒）
     CACHE_ENABLED: bool = True
+    CACHE_WATCH_ENABLED: bool = True  # 监听文件变化使缓存及时失效，TTL仍作为兜底
+    
+    # 并发I/O配置
+    BLOG_IO_CONCURRENCY: int = Field(64, gt=0)  # 扫描时同时读取的文章文件数上限，NAS等网络存储可适当调高
+    BLOG_PROCESS_POOL_THRESHOLD: int = 200  # 全量扫描文章数超过该值时改用多进程解析
     
     # 安全配置
     SECRET_KEY: str = "your-secret-key-here"
@@ -2,13 +2,15 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import time
-from datetime import datetime
+import asyncio
 from contextlib import asynccontextmanager
 
 from app.api.v1 import blog, health
 from app.core.config import settings
+from app.core.clock import utc_timestamp
+from app.services.blog import shutdown_process_pool
 
 
 @asynccontextmanager
@@ -16,9 +18,18 @@ async def lifespan(app: FastAPI):
     """应用生命周期管理"""
     # 启动时执行
     print("🚀 URAK Blog API 服务启动中...")
+    watch_task = None
+    if settings.CACHE_ENABLED and settings.CACHE_WATCH_ENABLED:
+        watch_task = asyncio.create_task(blog.blog_service.watch_for_changes())
     yield
     # 关闭时执行
     print("🛑 URAK Blog API 服务正在关闭...")
+    if watch_task is not None:
+        # 通过停止事件让监听线程自行退出，直接取消任务会遗留仍在运行的监听线程
+        blog.blog_service.stop_watching()
+        await watch_task
+    await blog.blog_service.flush_pending_save()
+    shutdown_process_pool()
     print("✅ 资源清理完成，服务已优雅退出")
 
 
@@ -30,6 +41,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # 配置CORS中间件
@@ -59,7 +71,7 @@ async def add_process_time_header(request, call_next):
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """404错误处理"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "success": False,
@@ -68,7 +80,7 @@ async def not_found_handler(request, exc):
                 "message": "请求的资源不存在",
                 "details": {"path": str(request.url.path)}
             },
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_timestamp()
         }
     )
 
@@ -76,7 +88,7 @@ async def not_found_handler(request, exc):
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
     """500错误处理"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -85,7 +97,7 @@ async def internal_error_handler(request, exc):
                 "message": "服务器内部错误",
                 "details": {}
             },
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_timestamp()
         }
     )
 
@@ -101,16 +113,5 @@ async def root():
             "docs": "/docs",
             "redoc": "/redoc"
         },
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": utc_timestamp()
     }
-
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
@@ -1,6 +1,5 @@
 """博客数据模型"""
 
-from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
 
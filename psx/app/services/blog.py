@@ -1,14 +1,48 @@
 """博客服务层"""
 
 import os
-import json
+import sys
+import stat
+import zlib
+import struct
 import asyncio
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-from pathlib import Path
+import logging
+import tempfile
+from concurrent.futures import Executor
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Set, Tuple, Any
+
+import aiofiles
+import orjson
+from watchfiles import awatch
 
 from app.core.config import settings
-from app.models.blog import Article, Category, BlogData
+from app.core.clock import utc_timestamp
+
+logger = logging.getLogger(__name__)
+
+# JSON回写的防抖延迟（秒），短时间内的多次扫描只写一次磁盘
+SAVE_DEBOUNCE_DELAY = 0.5
+
+# Markdown 渲染模板，模块加载时绑定一次
+_TITLE_FMT = "# {}\n\n".format
+_PARA_FMT = "{}\n\n".format
+_LIST_ITEM_FMT = "- {}\n".format
+_CODE_FMT = "```\n{}\n```\n\n".format
+
+# 分类默认描述的后缀
+CATEGORY_DESC_SUFFIX = "相关内容"
+
+# 列表类接口不返回的文章字段
+LISTING_EXCLUDED_FIELDS = frozenset(("content", "blocks", "structuredContent"))
+
+# 分类目录下的配置文件名，扫描文章时需要排除
+CATEGORY_CONFIG_FILE = "config.json"
+
+# 预压缩响应的gzip压缩级别
+GZIP_LEVEL = 6
+# gzip成员头：deflate压缩、无附加字段、不记录修改时间
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
 
 
 class BlogService:
@@ -18,9 +52,47 @@ class BlogService:
         self._cache: Optional[Dict[str, Any]] = None
         self._cache_timestamp: Optional[float] = None
         self.cache_ttl = settings.CACHE_TTL
+        # 预先解析数据路径，避免热路径上重复构造 Path 对象
+        self._categories_root = os.fspath(settings.CATEGORIES_DIR)
+        # 文章详情依次在内容目录和分类目录中查找
+        self._article_roots = (os.fspath(settings.CONTENT_DIR), self._categories_root)
+        self._blog_data_file = os.fspath(settings.BLOG_DATA_FILE)
+        # 文件监听的停止事件，监听使缓存及时失效，TTL仍作为兜底
+        self._watch_stop: Optional[asyncio.Event] = None
+        # 最近一次加载得到的分类数，供健康检查使用，避免每次探测都扫描目录
+        self.last_category_count: Optional[int] = None
+        # 正在进行中的刷新任务，缓存失效时并发请求共享同一次扫描
+        self._in_flight: Optional[asyncio.Future] = None
+        # 缓存代数，每次清除缓存时递增，清除前开始的刷新结果不再写入缓存
+        self._generation = 0
+        # 延迟回写JSON文件的定时器与写入任务
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._pending_save: Optional[Dict[str, Any]] = None
+        self._save_task: Optional[asyncio.Task] = None
+        # 最近一次解析的博客数据文件：((修改时间ns, 文件大小), 数据)
+        self._json_source: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        # 文章详情缓存：文件路径 -> (修改时间ns, 文件大小, 文章信息)
+        self._article_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        # 已序列化的响应数据：键 -> (源数据对象, JSON字节)，源数据对象变化即视为失效
+        self._serialized: Dict[str, Tuple[Any, bytes]] = {}
+        # 预压缩的响应数据：键 -> (源数据字节, 压缩任务)，任务结果为 (deflate块, CRC32)
+        self._compressed: Dict[str, Tuple[bytes, asyncio.Future]] = {}
+        # 限制并发读取的文章文件数，首次使用时创建
+        self._io_sem: Optional[asyncio.Semaphore] = None
         
     async def clear_cache(self):
         """清除缓存"""
+        self._invalidate()
+        self._serialized.clear()
+        self._compressed.clear()
+        self._article_cache.clear()
+        self._json_source = None
+        
+    def _invalidate(self):
+        """使缓存的博客数据失效，按源数据或文件状态校验的缓存保留"""
+        self._generation += 1
+        # 进行中的刷新可能读到了变化前的数据，后续请求需重新加载
+        self._in_flight = None
         self._cache = None
         self._cache_timestamp = None
         
@@ -35,6 +107,83 @@ class BlogService:
         import time
         return (time.time() - self._cache_timestamp) < self.cache_ttl
         
+    async def watch_for_changes(self):
+        """监听分类目录和博客数据文件的变化
+        
+        分类目录变化时重新扫描并回写博客数据文件，博客数据文件被外部修改时重新加载。
+        网络文件系统上可能收不到变化通知，缓存仍按TTL过期。
+        """
+        if self._watch_stop is None:
+            self._watch_stop = asyncio.Event()
+        stop_event = self._watch_stop
+        
+        watchers = []
+        if os.path.isdir(self._categories_root):
+            watchers.append(self._watch_categories(stop_event))
+        if os.path.isdir(os.path.dirname(os.path.abspath(self._blog_data_file))):
+            watchers.append(self._watch_blog_data_file(stop_event))
+            
+        try:
+            await asyncio.gather(*watchers)
+        finally:
+            # 任一监听异常退出时一并停止其余监听
+            stop_event.set()
+            self._watch_stop = None
+            
+    async def _watch_categories(self, stop_event: asyncio.Event):
+        """递归监听分类目录下的JSON文件"""
+        async for changes in awatch(self._categories_root, watch_filter=_is_json_change, stop_event=stop_event):
+            self._on_categories_change(changes)
+            
+    async def _watch_blog_data_file(self, stop_event: asyncio.Event):
+        """监听博客数据文件
+        
+        回写通过替换文件完成，直接监听文件会在首次替换后失效，因此不递归地监听所在目录并只关注该文件。
+        """
+        json_path = os.path.abspath(self._blog_data_file)
+        file_name = os.path.basename(json_path)
+        async for _ in awatch(
+            os.path.dirname(json_path),
+            watch_filter=lambda change, path: os.path.basename(path) == file_name,
+            recursive=False,
+            stop_event=stop_event
+        ):
+            self._on_blog_data_change()
+            
+    def _on_categories_change(self, changes: Set[Tuple[Any, str]]):
+        """分类目录中的文件变化时，清除相关文章的缓存并跳过博客数据文件重新扫描"""
+        categories_root = os.path.abspath(self._categories_root)
+        for _, path in changes:
+            relative = os.path.relpath(path, categories_root)
+            category, file_name = os.path.split(relative)
+            if not category or os.path.dirname(category):
+                continue
+                
+            article_id = os.path.splitext(file_name)[0]
+            self._article_cache.pop(os.path.join(self._categories_root, category, file_name), None)
+            self._serialized.pop(f"article:{category}/{article_id}", None)
+            
+        self._start_rescan().add_done_callback(self._log_refresh_error)
+        
+    def _on_blog_data_change(self):
+        """博客数据文件变化时重新加载，本服务自己回写的文件不会引起缓存失效"""
+        try:
+            file_stat = os.stat(self._blog_data_file)
+            file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        except FileNotFoundError:
+            file_key = None
+            
+        if self._json_source is not None and self._json_source[0] == file_key:
+            return
+            
+        self._invalidate()
+            
+    def stop_watching(self):
+        """通知文件监听退出，监听线程会在下一个轮询周期内结束"""
+        if self._watch_stop is None:
+            self._watch_stop = asyncio.Event()
+        self._watch_stop.set()
+            
     async def get_blog_data(self) -> Dict[str, Any]:
         """获取博客数据
         
@@ -45,18 +194,209 @@ class BlogService:
         if self._is_cache_valid():
             return self._cache
             
-        # 优先从JSON文件读取
-        json_data = await self._load_from_json()
+        # shield 保证某个调用方被取消时不会中断共享的加载任务
+        return await asyncio.shield(self._start_refresh())
+        
+    async def rescan(self) -> Dict[str, Any]:
+        """跳过博客数据文件重新扫描文件系统，扫描结果随后回写到博客数据文件
+        
+        Returns:
+            Dict[str, Any]: 博客数据字典
+        """
+        return await asyncio.shield(self._start_rescan())
+        
+    def _start_rescan(self) -> asyncio.Future:
+        """启动文件系统扫描，取代进行中的刷新
+        
+        Returns:
+            asyncio.Future: 扫描任务，并发调用方共享同一结果
+        """
+        self._invalidate()
+        self._in_flight = asyncio.ensure_future(
+            self._refresh_blog_data(self._generation, from_filesystem=True)
+        )
+        self._in_flight.add_done_callback(self._clear_in_flight)
+        return self._in_flight
+        
+    def _start_refresh(self) -> asyncio.Future:
+        """启动后台刷新任务，已有进行中的任务时直接复用
+        
+        Returns:
+            asyncio.Future: 刷新任务，并发调用方共享同一结果
+        """
+        # 合并并发请求：只有第一个调用方执行加载，其余等待同一结果
+        if self._in_flight is None:
+            self._in_flight = asyncio.ensure_future(self._refresh_blog_data(self._generation))
+            self._in_flight.add_done_callback(self._clear_in_flight)
+        return self._in_flight
+        
+    async def get_blog_data_json(self) -> bytes:
+        """获取序列化后的博客数据
+        
+        Returns:
+            bytes: 博客数据的JSON字节，缓存有效期内重复请求不再重新序列化
+        """
+        blog_data = await self.get_blog_data()
+        return self._serialize("blog-data", blog_data, lambda: {
+            **blog_data,
+            "categories": self._listing_categories(blog_data.get("categories", {}))
+        })
+        
+    async def get_categories_json(self) -> bytes:
+        """获取序列化后的分类列表
+        
+        Returns:
+            bytes: 分类列表的JSON字节
+        """
+        blog_data = await self.get_blog_data()
+        categories = blog_data.get("categories", {})
+        return self._serialize("categories", categories, lambda: {
+            "blogInfoPool": self._listing_categories(categories)
+        })
+        
+    async def get_category_json(self, category: str) -> Optional[bytes]:
+        """获取序列化后的分类内容
+        
+        Args:
+            category: 分类标识符
+            
+        Returns:
+            Optional[bytes]: 分类信息的JSON字节，如果不存在返回None
+        """
+        category_data = await self.get_category_content(category)
+        if category_data is None:
+            return None
+            
+        return self._serialize(
+            f"category:{category}", category_data, lambda: self._listing_category(category_data)
+        )
+        
+    async def get_article_json(self, category: str, article_id: str) -> Optional[bytes]:
+        """获取序列化后的文章内容
+        
+        Args:
+            category: 分类标识符
+            article_id: 文章ID
+            
+        Returns:
+            Optional[bytes]: 文章信息的JSON字节，文件未修改时复用上次的序列化结果
+        """
+        article = await self.get_article_content(category, article_id)
+        if article is None:
+            return None
+            
+        return self._serialize(f"article:{category}/{article_id}", article)
+        
+    @classmethod
+    def _listing_categories(cls, categories: Dict[str, Any]) -> Dict[str, Any]:
+        """构建所有分类的列表视图"""
+        return {
+            category_id: cls._listing_category(category_data)
+            for category_id, category_data in categories.items()
+        }
+        
+    @staticmethod
+    def _listing_category(category_data: Dict[str, Any]) -> Dict[str, Any]:
+        """构建分类的列表视图，文章只保留摘要字段，正文通过文章详情接口获取"""
+        articles = category_data.get("articles")
+        if not isinstance(articles, dict):
+            return category_data
+            
+        return {
+            **category_data,
+            "articles": {
+                article_id: {
+                    key: value for key, value in article.items()
+                    if key not in LISTING_EXCLUDED_FIELDS
+                }
+                for article_id, article in articles.items()
+            }
+        }
+        
+    def _serialize(self, key: str, source: Any, build: Optional[Callable[[], Any]] = None) -> bytes:
+        """序列化数据并按源数据对象缓存结果
+        
+        Args:
+            key: 缓存键
+            source: 源数据对象，缓存刷新后对象改变，旧的序列化结果随之失效
+            build: 构建实际序列化数据的函数，只在缓存未命中时调用，默认序列化 source
+        """
+        cached = self._serialized.get(key)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+            
+        data = orjson.dumps(source if build is None else build())
+        if settings.CACHE_ENABLED:
+            self._serialized[key] = (source, data)
+        return data
+        
+    async def compress(self, key: str, source: bytes, prefix: bytes, suffix: bytes) -> bytes:
+        """gzip压缩响应体，数据部分按源数据对象只压缩一次
+        
+        prefix + source 在线程中压缩为以同步刷新结尾的deflate块并缓存，并发请求共享同一次压缩；
+        每次请求只压缩较短的 suffix，拼接后仍是同一个gzip成员。
+        
+        Args:
+            key: 缓存键
+            source: 已序列化的数据字节，对象改变即视为失效
+            prefix: 数据之前的固定字节
+            suffix: 数据之后的字节，可随请求变化
+            
+        Returns:
+            bytes: gzip压缩后的响应体
+        """
+        entry = self._compressed.get(key)
+        if entry is None or entry[0] is not source:
+            task = asyncio.ensure_future(asyncio.to_thread(_deflate, prefix, source))
+            entry = (source, task)
+            if settings.CACHE_ENABLED:
+                self._compressed[key] = entry
+                
+        head, crc = await asyncio.shield(entry[1])
+        tail, crc = _deflate(suffix, crc=crc, final=True)
+        size = len(prefix) + len(source) + len(suffix)
+        return b"".join((GZIP_HEADER, head, tail, struct.pack("<II", crc, size & 0xFFFFFFFF)))
+        
+    @staticmethod
+    def _log_refresh_error(future: asyncio.Future):
+        """记录无人等待的后台刷新任务的异常"""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("后台刷新博客数据失败", exc_info=future.exception())
+            
+    def _clear_in_flight(self, future: asyncio.Future):
+        """加载任务结束后清除进行中标记"""
+        if self._in_flight is future:
+            self._in_flight = None
+            
+    async def _refresh_blog_data(self, generation: int, from_filesystem: bool = False) -> Dict[str, Any]:
+        """重新加载博客数据并更新缓存
+        
+        Args:
+            generation: 发起刷新时的缓存代数，期间缓存被清除则结果不写入缓存
+            from_filesystem: 是否跳过博客数据文件，文件系统变化后该文件可能已过期
+            
+        Returns:
+            Dict[str, Any]: 博客数据字典
+        """
+        # 优先从JSON文件读取，重新扫描时跳过
+        json_data = None if from_filesystem else await self._load_from_json()
         if json_data:
-            self._update_cache(json_data)
+            if generation == self._generation:
+                self.last_category_count = len(json_data["categories"])
+                self._update_cache(json_data)
             return json_data
             
         # 从文件系统扫描
         scanned_data = await self._scan_from_filesystem()
+        if generation != self._generation:
+            # 扫描期间缓存已被清除，结果可能早于文件变化，不写入缓存
+            return scanned_data
+            
+        self.last_category_count = len(scanned_data["categories"])
         self._update_cache(scanned_data)
         
-        # 保存到JSON文件
-        await self._save_to_json(scanned_data)
+        # 后台保存到JSON文件，不阻塞本次响应
+        self._schedule_save(scanned_data)
         
         return scanned_data
         
@@ -64,69 +404,150 @@ class BlogService:
         """更新缓存"""
         if settings.CACHE_ENABLED:
             import time
+            if data is not self._cache:
+                # 文章详情的序列化结果不依赖博客数据，按文章对象各自校验，无需清除
+                self._serialized = {
+                    key: entry for key, entry in self._serialized.items() if key.startswith("article:")
+                }
             self._cache = data
             self._cache_timestamp = time.time()
             
     async def _load_from_json(self) -> Optional[Dict[str, Any]]:
         """从JSON文件加载数据"""
         try:
-            json_path = Path(settings.BLOG_DATA_FILE)
-            if not json_path.exists():
+            try:
+                file_stat = os.stat(self._blog_data_file)
+            except FileNotFoundError:
                 return None
                 
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # 文件未修改时复用上次解析结果，TTL到期后的重新加载无需再次解析
+            file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+            if self._json_source is not None and self._json_source[0] == file_key:
+                return self._json_source[1]
+                
+            # 以二进制整体读取后交给 orjson 解析，省去文本解码
+            with open(self._blog_data_file, 'rb') as f:
+                data = orjson.loads(f.read())
                 
             # 验证数据结构
             if 'categories' in data:
+                data['categories'] = {
+                    sys.intern(category_id): category_data
+                    for category_id, category_data in data['categories'].items()
+                }
+                self._json_source = (file_key, data)
                 return data
                 
-        except Exception as e:
-            print(f"加载JSON文件失败: {e}")
+        except Exception:
+            logger.warning("加载JSON文件失败", exc_info=True)
             
         return None
         
+    def _schedule_save(self, data: Dict[str, Any]):
+        """延迟保存数据到JSON文件，连续的保存请求合并为一次写入"""
+        self._pending_save = data
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            
+        loop = asyncio.get_running_loop()
+        self._save_handle = loop.call_later(SAVE_DEBOUNCE_DELAY, self._start_save)
+        
+    def _start_save(self):
+        """防抖定时器到期后启动写入任务"""
+        data, self._pending_save = self._pending_save, None
+        self._save_handle = None
+        if data is not None:
+            self._save_task = asyncio.ensure_future(self._save_after(self._save_task, data))
+            
+    async def _save_after(self, previous: Optional[asyncio.Task], data: Dict[str, Any]):
+        """等待上一次写入完成后再写入，保证写入按顺序进行"""
+        if previous is not None:
+            await previous
+        await self._save_to_json(data)
+        
+    async def flush_pending_save(self):
+        """立即执行尚未触发的保存并等待写入完成"""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._start_save()
+            
+        if self._save_task is not None:
+            await self._save_task
+            self._save_task = None
+            
     async def _save_to_json(self, data: Dict[str, Any]):
         """保存数据到JSON文件"""
         try:
-            json_path = Path(settings.BLOG_DATA_FILE)
-            json_path.parent.mkdir(parents=True, exist_ok=True)
+            json_path = self._blog_data_file
+            os.makedirs(os.path.dirname(json_path), exist_ok=True)
             
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # orjson 直接输出UTF-8字节，省去 str 编码的二次遍历
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            
+            # 先写临时文件再原子替换，避免进程中断时留下半截JSON；
+            # 每次写入使用独立的临时文件，多个工作进程同时回写时互不覆盖
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(json_path), suffix=".tmp")
+            try:
+                # mkstemp 创建的文件仅属主可读，恢复为普通数据文件的权限
+                os.chmod(tmp_path, 0o644)
+                async with aiofiles.open(fd, 'wb') as f:
+                    await f.write(payload)
+                file_stat = os.stat(tmp_path)
+                await asyncio.to_thread(os.replace, tmp_path, json_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
                 
-        except Exception as e:
-            print(f"保存JSON文件失败: {e}")
+            # 记录写入的文件状态，之后的加载直接复用，文件监听也据此忽略这次写入
+            self._json_source = ((file_stat.st_mtime_ns, file_stat.st_size), data)
+            
+        except Exception:
+            logger.warning("保存JSON文件失败", exc_info=True)
             
     async def _scan_from_filesystem(self) -> Dict[str, Any]:
         """从文件系统扫描数据"""
-        categories = await self.scan_categories()
+        # 一次遍历取得全部分类及文章路径，再并发解析所有文章
+        tree = await asyncio.to_thread(self._walk_tree)
+        items = [(path, category_id) for category_id, paths in tree.items() for path in paths]
+        
+        # 文章较多时解析受GIL限制，改用多进程；数量少时线程池避免序列化开销
+        if len(items) > settings.BLOG_PROCESS_POOL_THRESHOLD:
+            parsed = await self._parse_in_processes(items)
+        else:
+            parsed = await asyncio.gather(*(
+                self._parse_listing_article_bounded(path, category_id)
+                for path, category_id in items
+            ))
         
-        blog_data = {
-            "categories": {},
-            "lastUpdated": datetime.utcnow().isoformat() + "Z",
+        articles_by_category: Dict[str, List[Dict[str, Any]]] = {category_id: [] for category_id in tree}
+        for article in parsed:
+            articles_by_category[article["category"]].append(article)
+            
+        return {
+            "categories": {
+                category_id: self._make_category(
+                    self._category_info(os.path.join(self._categories_root, category_id), category_id),
+                    self._sort_articles(articles)
+                )
+                for category_id, articles in articles_by_category.items()
+            },
+            "lastUpdated": utc_timestamp(),
             "source": "file_scan"
         }
         
-        for category_info in categories:
-            category_id = category_info["id"]
-            articles = await self.scan_articles(category_id)
-            
-            # 转换文章列表为字典格式（与unified_blog_api.py一致）
-            articles_dict = {}
-            for article in articles:
-                articles_dict[article["id"]] = article
-            
-            category_data = {
-                "title": category_info.get("name", category_id.replace('_', ' ').title()),
-                "href": f"/{category_id}",
-                "description": category_info.get("description", f"{category_info.get('name', category_id).replace('_', ' ').title()}相关内容"),
-                "articles": articles_dict
-            }
-            
-            blog_data["categories"][category_id] = category_data
+    @staticmethod
+    def _make_category(category_info: Dict[str, Any], articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """根据分类信息和文章列表构建分类数据"""
+        category_id = category_info["id"]
+        display_name = category_info.get("name") or category_id.replace('_', ' ').title()
         
-        return blog_data
+        return {
+            "title": display_name,
+            "href": "/" + category_id,
+            "description": category_info.get("description") or display_name + CATEGORY_DESC_SUFFIX,
+            # 转换文章列表为字典格式（与unified_blog_api.py一致）
+            "articles": {article["id"]: article for article in articles}
+        }
         
     async def scan_categories(self) -> List[Dict[str, Any]]:
         """扫描分类目录
@@ -134,33 +555,54 @@ class BlogService:
         Returns:
             List[Dict[str, Any]]: 分类信息列表
         """
-        categories = []
-        categories_dir = Path(settings.CATEGORIES_DIR)
-        
-        if not categories_dir.exists():
-            return categories
-            
-        for item in categories_dir.iterdir():
-            if item.is_dir():
-                category_info = {
-                    "id": item.name,
-                    "name": item.name.replace("-", " ").title(),
-                    "description": f"{item.name} 分类"
-                }
-                
-                # 检查是否有分类配置文件
-                config_file = item / "config.json"
-                if config_file.exists():
-                    try:
-                        with open(config_file, 'r', encoding='utf-8') as f:
-                            config = json.load(f)
-                            category_info.update(config)
-                    except Exception:
-                        pass
-                        
-                categories.append(category_info)
-                
-        return categories
+        if not os.path.isdir(self._categories_root):
+            return []
+            
+        with os.scandir(self._categories_root) as entries:
+            return [self._category_info(entry.path, entry.name) for entry in entries if entry.is_dir()]
+        
+    def _category_info(self, category_dir: str, category_id: str) -> Dict[str, Any]:
+        """构建分类信息，存在 config.json 时合并其中的配置"""
+        category_info = {
+            "id": category_id,
+            "name": category_id.replace("-", " ").title(),
+            "description": f"{category_id} 分类"
+        }
+        
+        # 检查是否有分类配置文件
+        try:
+            with open(os.path.join(category_dir, CATEGORY_CONFIG_FILE), 'rb') as f:
+                category_info.update(orjson.loads(f.read()))
+        except Exception:
+            pass
+            
+        return category_info
+        
+    def _walk_tree(self) -> Dict[str, List[str]]:
+        """一次遍历分类目录树
+        
+        Returns:
+            Dict[str, List[str]]: 分类ID到其文章文件路径列表的映射
+        """
+        if not os.path.isdir(self._categories_root):
+            return {}
+            
+        with os.scandir(self._categories_root) as entries:
+            return {
+                sys.intern(entry.name): self._list_article_files(entry.path)
+                for entry in entries if entry.is_dir()
+            }
+        
+    @staticmethod
+    def _list_article_files(category_dir: str) -> List[str]:
+        """列出分类目录下的文章JSON文件（不含分类配置文件）"""
+        with os.scandir(category_dir) as entries:
+            return [
+                entry.path for entry in entries
+                if entry.is_file()
+                and entry.name.lower().endswith('.json')
+                and entry.name != CATEGORY_CONFIG_FILE
+            ]
         
     async def scan_articles(self, category: str) -> List[Dict[str, Any]]:
         """扫描指定分类下的文章
@@ -171,150 +613,104 @@ class BlogService:
         Returns:
             List[Dict[str, Any]]: 文章信息列表
         """
-        articles = []
-        category_dir = Path(settings.CATEGORIES_DIR) / category
+        category_dir = os.path.join(self._categories_root, category)
         
-        if not category_dir.exists():
-            return articles
+        if not os.path.isdir(category_dir):
+            return []
             
-        for item in category_dir.iterdir():
-            if item.is_file() and item.suffix.lower() == '.json':
-                article_id = item.stem
-                
-                # 尝试解析JSON文件
-                try:
-                    with open(item, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # 适配unified_blog_api.py的数据结构
-                    if 'meta' in data and 'content' in data:
-                        meta = data['meta']
-                        content = data['content']
-                        
-                        # 处理content - 如果是结构化内容，转换为字符串
-                        content_str = ""
-                        if isinstance(content, dict) and 'blocks' in content:
-                            # 提取文本内容
-                            for block in content.get('blocks', []):
-                                if block.get('type') == 'title':
-                                    content_str += f"# {block.get('data', {}).get('text', '')}\n\n"
-                                elif block.get('type') == 'paragraph':
-                                    content_str += f"{block.get('data', {}).get('text', '')}\n\n"
-                                elif block.get('type') == 'list':
-                                    for item_data in block.get('data', {}).get('items', []):
-                                        content_str += f"- {item_data}\n"
-                                    content_str += "\n"
-                                elif block.get('type') == 'code':
-                                    code_text = block.get('data', {}).get('code', '')
-                                    content_str += f"```\n{code_text}\n```\n\n"
-                        elif isinstance(content, str):
-                            content_str = content
-                        else:
-                            content_str = json.dumps(content, ensure_ascii=False)
-                        
-                        article_info = {
-                            "id": article_id,
-                            "title": meta.get('title', article_id.replace("-", " ").title()),
-                            "category": category,
-                            "publishDate": meta.get('publishDate', ''),
-                            "content": content_str,
-                            "excerpt": meta.get('excerpt', meta.get('description', '')),
-                            "tags": meta.get('tags', []),
-                            "readTime": meta.get('readTime', ''),
-                            "author": meta.get('author', ''),
-                            "imagePath": meta.get('imagePath', ''),
-                            "source": "file_system",
-                            "structuredContent": content if isinstance(content, dict) else None
-                        }
-                    else:
-                        # 兼容其他JSON格式
-                        article_info = {
-                            "id": article_id,
-                            "title": data.get('title', article_id.replace("-", " ").title()),
-                            "category": category,
-                            "publishDate": data.get('publishDate', data.get('date', '')),
-                            "content": str(data.get('content', '')),
-                            "excerpt": data.get('excerpt', data.get('summary', '')),
-                            "tags": data.get('tags', []),
-                            "readTime": data.get('readTime', ''),
-                            "author": data.get('author', ''),
-                            "imagePath": data.get('imagePath', ''),
-                            "source": "file_system"
-                        }
-                        
-                except Exception as e:
-                    print(f"读取文章文件失败 {item}: {e}")
-                    article_info = {
-                        "id": article_id,
-                        "title": article_id.replace("-", " ").title(),
-                        "category": category,
-                        "publishDate": "",
-                        "content": "",
-                        "excerpt": "无法读取文章内容",
-                        "tags": [],
-                        "readTime": "",
-                        "author": "",
-                        "imagePath": "",
-                        "source": "error"
-                    }
-                    
-                articles.append(article_info)
-                
-        # 按发布日期排序
-        articles.sort(key=lambda x: x.get("publishDate", ""), reverse=True)
+        paths = await asyncio.to_thread(self._list_article_files, category_dir)
+        articles = await asyncio.gather(
+            *(self._parse_listing_article_bounded(path, category) for path in paths)
+        )
+        
+        return self._sort_articles(list(articles))
+        
+    async def _parse_in_processes(self, items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """将文章按批分发到进程池中解析"""
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+        batch_size = -(-len(items) // (os.cpu_count() or 1))
         
+        batches = await asyncio.gather(*(
+            loop.run_in_executor(pool, _parse_batch, items[i:i + batch_size])
+            for i in range(0, len(items), batch_size)
+        ))
+        return [article for batch in batches for article in batch]
+        
+    async def _parse_listing_article_bounded(self, path: str, category: str) -> Dict[str, Any]:
+        """在并发上限内于线程池中解析文章摘要，避免大量文件同时打开耗尽文件描述符"""
+        if self._io_sem is None:
+            self._io_sem = asyncio.Semaphore(settings.BLOG_IO_CONCURRENCY)
+            
+        async with self._io_sem:
+            return await asyncio.to_thread(self._parse_listing_article, path, category)
+        
+    @staticmethod
+    def _parse_listing_article(path: str, category: str) -> Dict[str, Any]:
+        """解析列表场景使用的文章摘要，并附带排序键"""
+        article_id = os.path.splitext(os.path.basename(path))[0]
+        article = BlogService._parse_article_file(
+            path, category, article_id, include_content=False, include_structured=False
+        )
+        article["_sort_key"] = article["publishDate"] or ""
+        return article
+        
+    @staticmethod
+    def _sort_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """按发布日期排序，排序键在解析时预先计算"""
+        articles.sort(key=itemgetter("_sort_key"), reverse=True)
+        for article in articles:
+            del article["_sort_key"]
+            
         return articles
         
-    async def get_article_content(self, category: str, article_id: str) -> Optional[Dict[str, Any]]:
-        """获取指定文章内容
+    @staticmethod
+    def _parse_article_file(
+        path: str,
+        category: str,
+        article_id: str,
+        include_content: bool = True,
+        include_structured: bool = True
+    ) -> Dict[str, Any]:
+        """读取并解析单个文章文件
         
         Args:
+            path: 文章JSON文件路径
             category: 分类标识符
             article_id: 文章ID
+            include_content: 是否渲染正文，列表场景不需要正文
+            include_structured: 是否附带原始结构化内容
             
         Returns:
-            Optional[Dict[str, Any]]: 文章信息，如果不存在返回None
+            Dict[str, Any]: 文章信息，读取失败时返回 source 为 error 的占位数据
         """
-        # 直接从文件系统加载文章，参考unified_blog_api.py的逻辑
         try:
-            article_file = Path(settings.CATEGORIES_DIR) / category / f"{article_id}.json"
-            
-            if not article_file.exists():
-                return None
-                
-            with open(article_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
             
-            # 处理meta+content结构（参考unified_blog_api.py）
+            # 适配unified_blog_api.py的数据结构
             if 'meta' in data and 'content' in data:
                 meta = data['meta']
                 content = data['content']
                 
-                # 处理结构化内容转换为字符串
-                content_str = ""
-                if isinstance(content, dict) and 'blocks' in content:
-                    for block in content.get('blocks', []):
-                        if block.get('type') == 'title':
-                            content_str += f"# {block.get('data', {}).get('text', '')}\n\n"
-                        elif block.get('type') == 'content':
-                            content_str += f"{block.get('data', {}).get('text', '')}\n\n"
-                        elif block.get('type') == 'paragraph':
-                            content_str += f"{block.get('data', {}).get('text', '')}\n\n"
-                        elif block.get('type') == 'list':
-                            for item_data in block.get('data', {}).get('items', []):
-                                content_str += f"- {item_data}\n"
-                            content_str += "\n"
-                        elif block.get('type') == 'code':
-                            code_text = block.get('data', {}).get('code', '')
-                            content_str += f"```\n{code_text}\n```\n\n"
+                # 处理content - 如果是结构化内容，转换为字符串
+                content_type = "text"
+                if not include_content:
+                    content_str = ""
+                elif isinstance(content, dict) and 'blocks' in content:
+                    content_str = BlogService._render_blocks(content)
                 elif isinstance(content, str):
                     content_str = content
+                elif include_structured and isinstance(content, dict):
+                    # 原始结构已通过 structuredContent 返回，不再重复序列化为字符串
+                    content_str = ""
+                    content_type = "structured"
                 else:
-                    content_str = json.dumps(content, ensure_ascii=False)
+                    content_str = orjson.dumps(content).decode()
                 
-                return {
+                article_info = {
                     "id": article_id,
-                    "title": meta.get('title', article_id.replace("-", " ").title()),
+                    "title": meta.get('title') or article_id.replace("-", " ").title(),
                     "category": category,
                     "publishDate": meta.get('publishDate', ''),
                     "content": content_str,
@@ -323,28 +719,97 @@ class BlogService:
                     "readTime": meta.get('readTime', ''),
                     "author": meta.get('author', ''),
                     "imagePath": meta.get('imagePath', ''),
-                    "source": "file_system",
-                    "structuredContent": content if isinstance(content, dict) else None
-                }
-            else:
-                # 兼容其他JSON格式
-                return {
-                    "id": article_id,
-                    "title": data.get('title', article_id.replace("-", " ").title()),
-                    "category": category,
-                    "publishDate": data.get('publishDate', data.get('date', '')),
-                    "content": str(data.get('content', '')),
-                    "excerpt": data.get('excerpt', data.get('summary', '')),
-                    "tags": data.get('tags', []),
-                    "readTime": data.get('readTime', ''),
-                    "author": data.get('author', ''),
-                    "imagePath": data.get('imagePath', ''),
                     "source": "file_system"
                 }
+                if include_structured:
+                    article_info["contentType"] = content_type
+                    article_info["structuredContent"] = content if isinstance(content, dict) else None
+                return article_info
+                
+            # 兼容其他JSON格式
+            return {
+                "id": article_id,
+                "title": data.get('title') or article_id.replace("-", " ").title(),
+                "category": category,
+                "publishDate": data.get('publishDate', data.get('date', '')),
+                "content": str(data.get('content', '')) if include_content else "",
+                "excerpt": data.get('excerpt', data.get('summary', '')),
+                "tags": data.get('tags', []),
+                "readTime": data.get('readTime', ''),
+                "author": data.get('author', ''),
+                "imagePath": data.get('imagePath', ''),
+                "source": "file_system"
+            }
                 
-        except Exception as e:
-            print(f"读取文章文件失败 {category}/{article_id}: {e}")
+        except Exception:
+            logger.warning("读取文章文件失败 %s", path, exc_info=True)
+            return {
+                "id": article_id,
+                "title": article_id.replace("-", " ").title(),
+                "category": category,
+                "publishDate": "",
+                "content": "",
+                "excerpt": "无法读取文章内容",
+                "tags": [],
+                "readTime": "",
+                "author": "",
+                "imagePath": "",
+                "source": "error"
+            }
+            
+    @staticmethod
+    def _render_blocks(content: Dict[str, Any]) -> str:
+        """将结构化内容块渲染为Markdown文本"""
+        parts = []
+        for block in content.get('blocks', []):
+            block_type = block.get('type')
+            data = block.get('data', {})
+            if block_type == 'title':
+                parts.append(_TITLE_FMT(data.get('text', '')))
+            elif block_type in ('content', 'paragraph'):
+                parts.append(_PARA_FMT(data.get('text', '')))
+            elif block_type == 'list':
+                parts.extend(map(_LIST_ITEM_FMT, data.get('items', [])))
+                parts.append("\n")
+            elif block_type == 'code':
+                parts.append(_CODE_FMT(data.get('code', '')))
+        return "".join(parts)
+        
+    async def get_article_content(self, category: str, article_id: str) -> Optional[Dict[str, Any]]:
+        """获取指定文章内容
+        
+        Args:
+            category: 分类标识符
+            article_id: 文章ID
+            
+        Returns:
+            Optional[Dict[str, Any]]: 文章信息，如果不存在返回None
+        """
+        file_name = article_id + ".json"
+        for root in self._article_roots:
+            article_file = os.path.join(root, category, file_name)
+            try:
+                file_stat = os.stat(article_file)
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                break
+        else:
+            return None
+            
+        # 文件未修改时直接复用上次解析结果，stat 远比重新读取解析便宜
+        cached = self._article_cache.get(article_file)
+        if cached is not None and cached[0] == file_stat.st_mtime_ns and cached[1] == file_stat.st_size:
+            return cached[2]
+            
+        article = self._parse_article_file(
+            article_file, category, article_id, include_content=True, include_structured=True
+        )
+        if article["source"] == "error":
             return None
+            
+        self._article_cache[article_file] = (file_stat.st_mtime_ns, file_stat.st_size, article)
+        return article
         
     async def get_category_content(self, category: str) -> Optional[Dict[str, Any]]:
         """获取指定分类内容
@@ -355,9 +820,86 @@ class BlogService:
         Returns:
             Optional[Dict[str, Any]]: 分类信息，如果不存在返回None
         """
-        blog_data = await self.get_blog_data()
-        
-        if category not in blog_data.get("categories", {}):
+        if self._is_cache_valid() or self._in_flight is not None or os.path.isfile(self._blog_data_file):
+            blog_data = await self.get_blog_data()
+            # 请求路径中的分类ID不做驻留，避免任意URL撑大驻留表
+            return blog_data.get("categories", {}).get(category)
+            
+        # 缓存为空且需要全量扫描时，只扫描请求的分类，首个请求的耗时取决于该分类的规模
+        category_dir = os.path.join(self._categories_root, category)
+        if category in (os.curdir, os.pardir) or not os.path.isdir(category_dir):
             return None
             
-        return blog_data["categories"][category]
\ No newline at end of file
+        category_data = self._make_category(
+            self._category_info(category_dir, category),
+            await self.scan_articles(category)
+        )
+        
+        # 随后在后台完成全量扫描，后续请求直接命中缓存
+        self._start_refresh().add_done_callback(self._log_refresh_error)
+        return category_data
+
+
+def _is_json_change(change: Any, path: str) -> bool:
+    """只关注JSON文件的变化"""
+    return path.endswith(".json")
+
+
+def _deflate(*chunks: bytes, crc: int = 0, final: bool = False) -> Tuple[bytes, int]:
+    """将数据压缩为原始deflate块，并在 crc 基础上累计CRC32
+
+    非结尾的片段以同步刷新收尾并按字节对齐，可直接与后续片段拼接在同一个gzip成员中。
+
+    Args:
+        chunks: 依次压缩的数据
+        crc: 之前片段的CRC32
+        final: 是否为最后一个片段
+
+    Returns:
+        Tuple[bytes, int]: deflate块和累计的CRC32
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    blocks = [compressor.compress(chunk) for chunk in chunks]
+    blocks.append(compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH))
+    for chunk in chunks:
+        crc = zlib.crc32(chunk, crc)
+    return b"".join(blocks), crc
+
+
+# 全量扫描时使用的进程池，首次需要时创建
+_process_pool: Optional[Executor] = None
+
+
+def _get_process_pool() -> Executor:
+    """获取共享进程池，只有大规模全量扫描才会用到，首次使用时再导入"""
+    global _process_pool
+    if _process_pool is None:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        # 服务进程中已有线程在运行，fork 出的子进程可能继承被占用的锁，改用 forkserver 启动
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context(method)
+        )
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """关闭共享进程池，服务退出时调用"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
+
+def _parse_batch(items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """在子进程中批量解析文章摘要
+
+    Args:
+        items: (文章文件路径, 分类标识符) 列表
+
+    Returns:
+        List[Dict[str, Any]]: 文章信息列表
+    """
+    return [BlogService._parse_listing_article(path, category) for path, category in items]
@@ -3,7 +3,6 @@
 import signal
 import sys
 import uvicorn
-from app.main import app
 from app.core.config import settings
 
 
@@ -19,13 +18,20 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)  # Ctrl+C
     signal.signal(signal.SIGTERM, signal_handler)  # 终止信号
     
+    # 热重载只支持单进程
+    workers = 1 if settings.DEBUG else settings.WORKERS
+    
     try:
         uvicorn.run(
             "app.main:app",
             host=settings.HOST,
             port=settings.PORT,
             reload=settings.DEBUG,
-            log_level=settings.LOG_LEVEL.lower()
+            workers=workers,
+            log_level=settings.LOG_LEVEL.lower(),
+            # 高并发下逐请求的访问日志开销明显，生产环境关闭
+            access_log=settings.DEBUG,
+            proxy_headers=True
         )
     except KeyboardInterrupt:
         print("\n服务器已优雅退出")
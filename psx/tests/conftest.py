@@ -0,0 +1,71 @@
+"""测试公共夹具"""
+
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import settings
+from app.services.blog import BlogService
+
+
+def write_article(path, title, publish_date, blocks=None):
+    """写入一篇结构化文章文件"""
+    path.write_text(json.dumps({
+        "meta": {
+            "title": title,
+            "publishDate": publish_date,
+            "excerpt": f"{title} 摘要",
+            "tags": ["测试"],
+        },
+        "content": {
+            "title": title,
+            "blocks": blocks or [{"type": "paragraph", "data": {"text": f"{title} 正文"}}],
+        },
+    }, ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture
+def blog_dirs(tmp_path, monkeypatch):
+    """创建临时文档目录，并让配置指向它"""
+    categories_dir = tmp_path / "categories"
+    content_dir = tmp_path / "content"
+    tech_dir = categories_dir / "tech"
+    life_dir = categories_dir / "life"
+    for path in (content_dir, tech_dir, life_dir):
+        path.mkdir(parents=True)
+        
+    (tech_dir / "config.json").write_text(
+        json.dumps({"name": "技术", "description": "技术文章"}, ensure_ascii=False), encoding="utf-8"
+    )
+    write_article(tech_dir / "1.json", "第一篇", "2024-01-01")
+    write_article(tech_dir / "2.json", "第二篇", "2024-02-01")
+    write_article(life_dir / "1.json", "生活", "2024-03-01")
+    
+    monkeypatch.setattr(settings, "DOCS_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "CATEGORIES_DIR", str(categories_dir))
+    monkeypatch.setattr(settings, "CONTENT_DIR", str(content_dir))
+    monkeypatch.setattr(settings, "BLOG_DATA_FILE", str(tmp_path / "blog-data.json"))
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "CACHE_TTL", 60)
+    return tmp_path
+
+
+@pytest.fixture
+async def service(blog_dirs):
+    """使用临时目录的博客服务"""
+    blog_service = BlogService()
+    yield blog_service
+    await blog_service.flush_pending_save()
+
+
+@pytest.fixture
+async def client(service, monkeypatch):
+    """请求应用的HTTP客户端，路由使用临时目录的博客服务"""
+    from app.api.v1 import blog, health
+    from app.main import app
+    
+    monkeypatch.setattr(blog, "blog_service", service)
+    monkeypatch.setattr(health, "blog_service", service)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http_client:
+        yield http_client
@@ -0,0 +1,145 @@
+"""博客API接口测试"""
+
+import asyncio
+import gzip
+
+from app.api.v1.blog import ENVELOPE_PREFIX, _accepts_gzip
+from app.services import blog as blog_module
+from app.services.blog import LISTING_EXCLUDED_FIELDS
+from tests.conftest import write_article
+
+
+async def test_blog_data_is_compact_by_default(client):
+    response = await client.get("/api/blog-data", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, s-maxage=60, stale-while-revalidate=300"
+    assert b"\n" not in response.content
+    body = response.json()
+    assert body["success"] is True
+    assert set(body["data"]["categories"]) == {"tech", "life"}
+
+
+async def test_pretty_query_indents_output(client):
+    response = await client.get("/api/articles/tech/1", params={"pretty": "1"})
+
+    assert response.status_code == 200
+    assert response.content.startswith(b'{\n  "success": true')
+    assert response.json()["data"]["id"] == "1"
+
+
+async def test_blog_data_served_gzip_when_accepted(client):
+    response = await client.get("/api/blog-data", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert set(response.json()["data"]["categories"]) == {"tech", "life"}
+
+
+async def test_blog_data_identity_when_gzip_refused(client):
+    response = await client.get("/api/blog-data", headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json()["success"] is True
+
+
+def test_accept_encoding_negotiation():
+    assert _accepts_gzip("gzip, deflate, br")
+    assert _accepts_gzip("br;q=1.0, gzip;q=0.8")
+    assert not _accepts_gzip(None)
+    assert not _accepts_gzip("identity")
+    assert not _accepts_gzip("gzip;q=0")
+    assert not _accepts_gzip("gzip;q=0.0")
+
+
+async def test_data_compressed_once_per_cache_fill(service, monkeypatch):
+    data = await service.get_blog_data_json()
+    calls = []
+    deflate = blog_module._deflate
+
+    def counting_deflate(*chunks, **kwargs):
+        if not kwargs.get("final"):
+            calls.append(1)
+        return deflate(*chunks, **kwargs)
+
+    monkeypatch.setattr(blog_module, "_deflate", counting_deflate)
+    first, second = await asyncio.gather(
+        service.compress("blog-data", data, ENVELOPE_PREFIX, b',"n":1}'),
+        service.compress("blog-data", data, ENVELOPE_PREFIX, b',"n":2}'),
+    )
+
+    assert len(calls) == 1
+    assert gzip.decompress(first) == ENVELOPE_PREFIX + data + b',"n":1}'
+    assert gzip.decompress(second) == ENVELOPE_PREFIX + data + b',"n":2}'
+
+    await service.clear_cache()
+    await service.compress("blog-data", await service.get_blog_data_json(), ENVELOPE_PREFIX, b"}")
+    assert len(calls) == 2
+
+
+async def test_list_endpoints_exclude_article_bodies(client):
+    blog_data = (await client.get("/api/blog-data")).json()["data"]
+    category = (await client.get("/api/categories/tech")).json()["data"]
+    categories = (await client.get("/api/categories")).json()["data"]["blogInfoPool"]
+
+    for listing in (*blog_data["categories"].values(), category, *categories.values()):
+        for article in listing["articles"].values():
+            assert not LISTING_EXCLUDED_FIELDS & article.keys()
+
+
+async def test_article_detail_and_not_found(client):
+    response = await client.get("/api/articles/tech/2")
+    assert response.status_code == 200
+    assert response.json()["data"]["title"] == "第二篇"
+
+    response = await client.get("/api/articles/tech/missing")
+    assert response.status_code == 404
+
+    response = await client.get("/api/categories/missing")
+    assert response.status_code == 404
+
+
+async def test_health_does_not_scan(client, service):
+    scans = []
+    scan_categories = service.scan_categories
+
+    async def counting_scan():
+        scans.append(1)
+        return await scan_categories()
+
+    service.scan_categories = counting_scan
+
+    response = await client.get("/health")
+    sources = response.json()["data"]["data_sources"]
+    assert response.status_code == 200
+    assert sources["categories_cached"] is None
+    assert "categories_from_scan" not in sources
+    assert scans == []
+
+    await client.get("/api/blog-data")
+    response = await client.get("/health")
+    assert response.json()["data"]["data_sources"]["categories_cached"] == 2
+    assert scans == []
+
+
+async def test_deep_health_scans_directory(client, service):
+    response = await client.get("/health/deep")
+
+    sources = response.json()["data"]["data_sources"]
+    assert response.status_code == 200
+    assert sources["categories_from_scan"] == 2
+    assert sources["json_file_exists"] is False
+
+
+async def test_scan_reloads_after_file_change(client, service, blog_dirs):
+    await client.get("/api/blog-data")
+    # 先让首次扫描结果回写到博客数据文件，扫描接口需绕过这份已过期的文件
+    await service.flush_pending_save()
+    write_article(blog_dirs / "categories" / "life" / "2.json", "新文章", "2024-05-01")
+
+    response = await client.get("/api/scan")
+    assert response.status_code == 200
+
+    category = (await client.get("/api/categories/life")).json()["data"]
+    assert set(category["articles"]) == {"1", "2"}
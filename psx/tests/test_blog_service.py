@@ -0,0 +1,233 @@
+"""博客服务层测试"""
+
+import asyncio
+import json
+import os
+
+import orjson
+
+from app.services import blog as blog_module
+from app.services.blog import LISTING_EXCLUDED_FIELDS
+from tests.conftest import write_article
+
+
+def count_scans(service):
+    """统计全量扫描次数"""
+    calls = []
+    scan = service._scan_from_filesystem
+
+    async def counting_scan():
+        calls.append(1)
+        return await scan()
+
+    service._scan_from_filesystem = counting_scan
+    return calls
+
+
+async def test_concurrent_loads_share_one_scan(service):
+    calls = count_scans(service)
+
+    results = await asyncio.gather(*(service.get_blog_data() for _ in range(10)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert set(results[0]["categories"]) == {"tech", "life"}
+
+
+async def test_valid_cache_skips_rescan(service):
+    calls = count_scans(service)
+
+    first = await service.get_blog_data()
+    second = await service.get_blog_data()
+
+    assert len(calls) == 1
+    assert second is first
+
+
+async def test_clear_during_refresh_discards_stale_result(service, blog_dirs):
+    release = asyncio.Event()
+    scan = service._scan_from_filesystem
+
+    async def slow_scan():
+        data = await scan()
+        await release.wait()
+        return data
+
+    service._scan_from_filesystem = slow_scan
+    stale_load = asyncio.ensure_future(service.get_blog_data())
+    await asyncio.sleep(0.05)
+
+    # 刷新进行中文件发生变化
+    write_article(blog_dirs / "categories" / "tech" / "3.json", "第三篇", "2024-04-01")
+    await service.clear_cache()
+    release.set()
+    await stale_load
+
+    assert service._cache is None
+    fresh = await service.get_blog_data()
+    assert "3" in fresh["categories"]["tech"]["articles"]
+
+
+async def test_watcher_rescans_on_article_change(service, blog_dirs):
+    await service.get_blog_data()
+    await service.flush_pending_save()
+    watch_task = asyncio.ensure_future(service.watch_for_changes())
+    await asyncio.sleep(0.2)
+
+    try:
+        write_article(blog_dirs / "categories" / "life" / "2.json", "新文章", "2024-05-01")
+        for _ in range(100):
+            if service._cache is None or service._in_flight is not None:
+                break
+            await asyncio.sleep(0.05)
+        data = await service.get_blog_data()
+    finally:
+        service.stop_watching()
+        await asyncio.wait_for(watch_task, timeout=5)
+
+    # 重新扫描不读取已过期的博客数据文件，并把新结果回写
+    assert set(data["categories"]["life"]["articles"]) == {"1", "2"}
+    await service.flush_pending_save()
+    saved = json.loads((blog_dirs / "blog-data.json").read_text(encoding="utf-8"))
+    assert set(saved["categories"]["life"]["articles"]) == {"1", "2"}
+
+
+async def test_own_writeback_does_not_invalidate(service):
+    data = await service.get_blog_data()
+    await service.get_article_content("tech", "1")
+    await service.flush_pending_save()
+    generation = service._generation
+
+    service._on_blog_data_change()
+
+    assert service._generation == generation
+    assert service._article_cache
+    assert await service.get_blog_data() is data
+
+
+async def test_external_blog_data_change_reloads(service, blog_dirs):
+    await service.get_blog_data()
+    await service.flush_pending_save()
+    (blog_dirs / "blog-data.json").write_text('{"categories": {"news": {}}}', encoding="utf-8")
+
+    service._on_blog_data_change()
+
+    assert set((await service.get_blog_data())["categories"]) == {"news"}
+
+
+async def test_article_change_drops_only_that_article(service, blog_dirs):
+    await service.get_blog_data()
+    for category, article_id in (("tech", "1"), ("tech", "2")):
+        await service.get_article_json(category, article_id)
+    changed = blog_dirs / "categories" / "tech" / "1.json"
+
+    service._on_categories_change({(None, str(changed))})
+    await service._in_flight
+
+    assert [os.path.basename(path) for path in service._article_cache] == ["2.json"]
+    assert "article:tech/1" not in service._serialized
+    assert "article:tech/2" in service._serialized
+
+
+async def test_saves_are_debounced(service, blog_dirs, monkeypatch):
+    monkeypatch.setattr(blog_module, "SAVE_DEBOUNCE_DELAY", 0.01)
+    writes = []
+    save = service._save_to_json
+
+    async def counting_save(data):
+        writes.append(data)
+        await save(data)
+
+    service._save_to_json = counting_save
+    for index in range(5):
+        service._schedule_save({"categories": {}, "index": index})
+    await asyncio.sleep(0.1)
+    await service.flush_pending_save()
+
+    assert len(writes) == 1
+    saved = json.loads((blog_dirs / "blog-data.json").read_text(encoding="utf-8"))
+    assert saved["index"] == 4
+    assert [path.name for path in blog_dirs.iterdir() if path.suffix == ".tmp"] == []
+
+
+async def test_flush_writes_pending_save_immediately(service, blog_dirs):
+    service._schedule_save({"categories": {}, "index": 1})
+    await service.flush_pending_save()
+
+    assert json.loads((blog_dirs / "blog-data.json").read_text(encoding="utf-8"))["index"] == 1
+
+
+async def test_overlapping_saves_land_in_order(service, blog_dirs):
+    for index in range(3):
+        service._pending_save = {"categories": {}, "index": index}
+        service._start_save()
+    await service.flush_pending_save()
+
+    assert json.loads((blog_dirs / "blog-data.json").read_text(encoding="utf-8"))["index"] == 2
+    assert [path.name for path in blog_dirs.iterdir() if path.suffix == ".tmp"] == []
+
+
+async def test_scan_writes_back_and_next_load_reads_json(service, blog_dirs):
+    await service.get_blog_data()
+    await service.flush_pending_save()
+    await service.clear_cache()
+
+    data = await service.get_blog_data()
+
+    assert (blog_dirs / "blog-data.json").exists()
+    assert set(data["categories"]) == {"tech", "life"}
+
+
+async def test_listing_json_excludes_article_bodies(service):
+    listing = orjson.loads(await service.get_blog_data_json())
+
+    for category in listing["categories"].values():
+        for article in category["articles"].values():
+            assert not LISTING_EXCLUDED_FIELDS & article.keys()
+
+    category = orjson.loads(await service.get_category_json("tech"))
+    assert category["title"] == "技术"
+    assert list(category["articles"]) == ["2", "1"]
+
+
+async def test_listing_projection_built_once_per_cache_fill(service, monkeypatch):
+    calls = []
+    listing_category = blog_module.BlogService._listing_category
+
+    def counting_listing(category_data):
+        calls.append(1)
+        return listing_category(category_data)
+
+    monkeypatch.setattr(blog_module.BlogService, "_listing_category", staticmethod(counting_listing))
+    first = await service.get_blog_data_json()
+    for _ in range(20):
+        assert await service.get_blog_data_json() is first
+
+    assert len(calls) == 2
+
+
+async def test_article_detail_keeps_structured_content(service):
+    article = await service.get_article_content("tech", "1")
+
+    assert article["title"] == "第一篇"
+    assert article["content"] == "第一篇 正文\n\n"
+    assert article["structuredContent"]["title"] == "第一篇"
+    assert await service.get_article_content("tech", "missing") is None
+
+
+async def test_cold_category_request_scans_only_that_category(service):
+    calls = count_scans(service)
+
+    category = await service.get_category_content("life")
+
+    assert list(category["articles"]) == ["1"]
+    # 单分类结果返回后，全量刷新在后台完成
+    assert service._in_flight is not None
+    await service._in_flight
+    assert len(calls) == 1
+    assert service._cache is not None
+
+
+async def test_cold_category_request_rejects_parent_dir(service):
+    assert await service.get_category_content("..") is None
+    assert await service.get_category_content("missing") is None